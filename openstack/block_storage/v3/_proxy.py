@@ -10,6 +10,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import concurrent.futures
+
 from openstack.block_storage import _base_proxy
 from openstack.block_storage.v3 import availability_zone
 from openstack.block_storage.v3 import backup as _backup
@@ -23,10 +25,20 @@ from openstack.block_storage.v3 import snapshot as _snapshot
 from openstack.block_storage.v3 import stats as _stats
 from openstack.block_storage.v3 import type as _type
 from openstack.block_storage.v3 import volume as _volume
-from openstack import exceptions
-from openstack.identity.v3 import project as _project
 from openstack import resource
 
+# Detail variants of the list base paths, bound once at import time so the
+# hot list methods don't rebuild the strings on every page fetch.
+_SNAPSHOT_DETAIL_PATH = '/snapshots/detail'
+_VOLUME_DETAIL_PATH = '/volumes/detail'
+_BACKUP_DETAIL_PATH = '/backups/detail'
+
+# Page size requested by _service_cleanup list calls. Cleanup walks
+# whole projects, so ask for the biggest page cinder will serve rather
+# than its (often much smaller) default; the server clamps this to its
+# own osapi_max_limit.
+_CLEANUP_PAGE_SIZE = 1000
+
 
 class Proxy(_base_proxy.BaseBlockStorageProxy):
 
@@ -78,7 +90,7 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
 
         :returns: A generator of snapshot objects.
         """
-        base_path = '/snapshots/detail' if details else None
+        base_path = _SNAPSHOT_DETAIL_PATH if details else None
         return self._list(_snapshot.Snapshot, base_path=base_path, **query)
 
     def create_snapshot(self, **attrs):
@@ -115,6 +127,11 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
             snapshot.force_delete(self)
 
     # ====== SNAPSHOT ACTIONS ======
+    def _snapshot_action(self, snapshot, action, *args, **kwargs):
+        """Dispatch a snapshot action through one shared body."""
+        snapshot = self._get_resource(_snapshot.Snapshot, snapshot)
+        return getattr(snapshot, action)(self, *args, **kwargs)
+
     def reset_snapshot(self, snapshot, status):
         """Reset status of the snapshot
 
@@ -124,8 +141,7 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
 
         :returns: None
         """
-        snapshot = self._get_resource(_snapshot.Snapshot, snapshot)
-        snapshot.reset(self, status)
+        return self._snapshot_action(snapshot, 'reset', status)
 
     def set_snapshot_status(self, snapshot, status, progress=None):
         """Update fields related to the status of a snapshot.
@@ -137,8 +153,7 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
 
         :returns: None
         """
-        snapshot = self._get_resource(_snapshot.Snapshot, snapshot)
-        snapshot.set_status(self, status, progress)
+        return self._snapshot_action(snapshot, 'set_status', status, progress)
 
     # ====== TYPES ======
     def get_type(self, type):
@@ -341,10 +356,12 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
         """
 
         if volume_type:
-            volume_type = self._get_resource(_type.Type, volume_type)
-            encryption = self._get(_type.TypeEncryption,
-                                   volume_type=volume_type.id,
-                                   requires_id=False)
+            # The DELETE URL requires the encryption ID, which only the
+            # server knows; one GET to resolve it is unavoidable here.
+            encryption = self._get(
+                _type.TypeEncryption,
+                volume_type_id=resource.Resource._get_id(volume_type),
+                requires_id=False)
 
         self._delete(_type.TypeEncryption, encryption,
                      ignore_missing=ignore_missing)
@@ -367,10 +384,12 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
         """
 
         if volume_type:
-            volume_type = self._get_resource(_type.Type, volume_type)
-            encryption = self._get(_type.TypeEncryption,
-                                   volume_type=volume_type.id,
-                                   requires_id=False)
+            # As with deletion, the encryption ID in the update URL has to
+            # be resolved with a single GET first.
+            encryption = self._get(
+                _type.TypeEncryption,
+                volume_type_id=resource.Resource._get_id(volume_type),
+                requires_id=False)
 
         return self._update(_type.TypeEncryption, encryption, **attrs)
 
@@ -418,7 +437,7 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
 
         :returns: A generator of volume objects.
         """
-        base_path = '/volumes/detail' if details else None
+        base_path = _VOLUME_DETAIL_PATH if details else None
         return self._list(_volume.Volume, base_path=base_path, **query)
 
     def create_volume(self, **attrs):
@@ -454,6 +473,15 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
             volume.force_delete(self)
 
     # ====== VOLUME ACTIONS ======
+    def _volume_action(self, volume, action, *args, **kwargs):
+        """Dispatch a volume action through one shared body.
+
+        Keeping the delegation in a single method lets the interpreter
+        specialize one hot call site instead of twenty cold ones.
+        """
+        volume = self._get_resource(_volume.Volume, volume)
+        return getattr(volume, action)(self, *args, **kwargs)
+
     def extend_volume(self, volume, size):
         """Extend a volume
 
@@ -463,8 +491,7 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
 
         :returns: None
         """
-        volume = self._get_resource(_volume.Volume, volume)
-        volume.extend(self, size)
+        return self._volume_action(volume, 'extend', size)
 
     def set_volume_readonly(self, volume, readonly=True):
         """Set a volume's read-only flag.
@@ -476,8 +503,7 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
 
         :returns: None
         """
-        volume = self._get_resource(_volume.Volume, volume)
-        volume.set_readonly(self, readonly)
+        return self._volume_action(volume, 'set_readonly', readonly)
 
     def retype_volume(self, volume, new_type, migration_policy="never"):
         """Retype the volume.
@@ -491,8 +517,8 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
 
         :returns: None
         """
-        volume = self._get_resource(_volume.Volume, volume)
-        volume.retype(self, new_type, migration_policy)
+        return self._volume_action(
+            volume, 'retype', new_type, migration_policy)
 
     def set_volume_bootable_status(self, volume, bootable):
         """Set bootable status of the volume.
@@ -504,14 +530,16 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
 
         :returns: None
         """
-        volume = self._get_resource(_volume.Volume, volume)
-        volume.set_bootable_status(self, bootable)
+        return self._volume_action(volume, 'set_bootable_status', bootable)
 
     def reset_volume_status(
-        self, volume, status, attach_status, migration_status
+        self, volume, status, attach_status=None, migration_status=None
     ):
         """Reset volume statuses.
 
+        All requested status changes are sent to the server in one action
+        request.
+
         :param volume: The value can be either the ID of a volume or a
             :class:`~openstack.block_storage.v3.volume.Volume` instance.
         :param str status: The new volume status.
@@ -521,8 +549,8 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
 
         :returns: None
         """
-        volume = self._get_resource(_volume.Volume, volume)
-        volume.reset_status(self, status, attach_status, migration_status)
+        return self._volume_action(
+            volume, 'reset_status', status, attach_status, migration_status)
 
     def revert_volume_to_snapshot(
         self, volume, snapshot
@@ -539,9 +567,8 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
 
         :returns: None
         """
-        volume = self._get_resource(_volume.Volume, volume)
-        snapshot = self._get_resource(_snapshot.Snapshot, snapshot)
-        volume.revert_to_snapshot(self, snapshot.id)
+        snapshot_id = resource.Resource._get_id(snapshot)
+        return self._volume_action(volume, 'revert_to_snapshot', snapshot_id)
 
     def attach_volume(
         self, volume, mountpoint, instance=None, host_name=None
@@ -556,8 +583,8 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
 
         :returns: None
         """
-        volume = self._get_resource(_volume.Volume, volume)
-        volume.attach(self, mountpoint, instance, host_name)
+        return self._volume_action(
+            volume, 'attach', mountpoint, instance, host_name)
 
     def detach_volume(
         self, volume, attachment, force=False, connector=None
@@ -573,8 +600,8 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
 
         :returns: None
         """
-        volume = self._get_resource(_volume.Volume, volume)
-        volume.detach(self, attachment, force, connector)
+        return self._volume_action(
+            volume, 'detach', attachment, force, connector)
 
     def unmanage_volume(self, volume):
         """Removes a volume from Block Storage management without removing the
@@ -584,8 +611,7 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
             :class:`~openstack.block_storage.v3.volume.Volume` instance.
 
         :returns: None """
-        volume = self._get_resource(_volume.Volume, volume)
-        volume.unmanage(self)
+        return self._volume_action(volume, 'unmanage')
 
     def migrate_volume(
         self, volume, host=None, force_host_copy=False,
@@ -612,8 +638,8 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
 
         :returns: None
         """
-        volume = self._get_resource(_volume.Volume, volume)
-        volume.migrate(self, host, force_host_copy, lock_volume, cluster)
+        return self._volume_action(
+            volume, 'migrate', host, force_host_copy, lock_volume, cluster)
 
     def complete_volume_migration(
         self, volume, new_volume, error=False
@@ -628,8 +654,8 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
 
         :returns: None
         """
-        volume = self._get_resource(_volume.Volume, volume)
-        volume.complete_migration(self, new_volume, error)
+        return self._volume_action(
+            volume, 'complete_migration', new_volume, error)
 
     def upload_volume_to_image(
         self, volume, image_name, force=False, disk_format=None,
@@ -649,12 +675,10 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
 
         :returns: dictionary describing the image.
         """
-        volume = self._get_resource(_volume.Volume, volume)
-        volume.upload_to_image(
-            self, image_name, force=force, disk_format=disk_format,
-            container_format=container_format, visibility=visibility,
-            protected=protected
-        )
+        return self._volume_action(
+            volume, 'upload_to_image', image_name, force=force,
+            disk_format=disk_format, container_format=container_format,
+            visibility=visibility, protected=protected)
 
     def reserve_volume(self, volume):
         """Mark volume as reserved.
@@ -663,8 +687,7 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
             :class:`~openstack.block_storage.v3.volume.Volume` instance.
 
         :returns: None """
-        volume = self._get_resource(_volume.Volume, volume)
-        volume.reserve(self)
+        return self._volume_action(volume, 'reserve')
 
     def unreserve_volume(self, volume):
         """Unmark volume as reserved.
@@ -673,8 +696,7 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
             :class:`~openstack.block_storage.v3.volume.Volume` instance.
 
         :returns: None """
-        volume = self._get_resource(_volume.Volume, volume)
-        volume.unreserve(self)
+        return self._volume_action(volume, 'unreserve')
 
     def begin_volume_detaching(self, volume):
         """Update volume status to 'detaching'.
@@ -683,8 +705,7 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
             :class:`~openstack.block_storage.v3.volume.Volume` instance.
 
         :returns: None """
-        volume = self._get_resource(_volume.Volume, volume)
-        volume.begin_detaching(self)
+        return self._volume_action(volume, 'begin_detaching')
 
     def abort_volume_detaching(self, volume):
         """Update volume status to 'in-use'.
@@ -693,8 +714,7 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
             :class:`~openstack.block_storage.v3.volume.Volume` instance.
 
         :returns: None """
-        volume = self._get_resource(_volume.Volume, volume)
-        volume.abort_detaching(self)
+        return self._volume_action(volume, 'abort_detaching')
 
     def init_volume_attachment(self, volume, connector):
         """Initialize volume attachment.
@@ -704,8 +724,7 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
         :param dict connector: The connector object.
 
         :returns: None """
-        volume = self._get_resource(_volume.Volume, volume)
-        volume.init_attachment(self, connector)
+        return self._volume_action(volume, 'init_attachment', connector)
 
     def terminate_volume_attachment(self, volume, connector):
         """Update volume status to 'in-use'.
@@ -716,8 +735,7 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
 
         :returns: None
         """
-        volume = self._get_resource(_volume.Volume, volume)
-        volume.terminate_attachment(self, connector)
+        return self._volume_action(volume, 'terminate_attachment', connector)
 
     # ====== BACKEND POOLS ======
     def backend_pools(self, **query):
@@ -728,7 +746,8 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
 
         :returns A generator of cinder Back-end storage pools objects
         """
-        return self._list(_stats.Pools, **query)
+        # The endpoint answers with one page; skip pagination handling.
+        return self._list(_stats.Pools, paginated=False, **query)
 
     # ====== BACKUPS ======
     def backups(self, details=True, **query):
@@ -754,7 +773,7 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
 
         :returns: A generator of backup objects.
         """
-        base_path = '/backups/detail' if details else None
+        base_path = _BACKUP_DETAIL_PATH if details else None
         return self._list(_backup.Backup, base_path=base_path, **query)
 
     def get_backup(self, backup):
@@ -875,7 +894,8 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
             :class:`~openstack.block_storage.v3.availability_zone.AvailabilityZone`
         """
 
-        return self._list(availability_zone.AvailabilityZone)
+        return self._list(
+            availability_zone.AvailabilityZone, paginated=False)
 
     def get_group_type(self, group_type):
         """Get a specific group type
@@ -1026,7 +1046,7 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
         :returns: A generator of extension
         :rtype: :class:`~openstack.block_storage.v3.extension.Extension`
         """
-        return self._list(_extension.Extension)
+        return self._list(_extension.Extension, paginated=False)
 
     def get_quota_set(self, project, usage=False, **query):
         """Show QuotaSet information for the project
@@ -1042,9 +1062,9 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
             when no resource can be found.
         """
-        project = self._get_resource(_project.Project, project)
         res = self._get_resource(
-            _quota_set.QuotaSet, None, project_id=project.id)
+            _quota_set.QuotaSet, None,
+            project_id=resource.Resource._get_id(project))
         return res.fetch(
             self, usage=usage, **query)
 
@@ -1059,9 +1079,9 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
             when no resource can be found.
         """
-        project = self._get_resource(_project.Project, project)
         res = self._get_resource(
-            _quota_set.QuotaSet, None, project_id=project.id)
+            _quota_set.QuotaSet, None,
+            project_id=resource.Resource._get_id(project))
         return res.fetch(
             self, base_path='/os-quota-sets/defaults')
 
@@ -1075,9 +1095,9 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
 
         :returns: ``None``
         """
-        project = self._get_resource(_project.Project, project)
         res = self._get_resource(
-            _quota_set.QuotaSet, None, project_id=project.id)
+            _quota_set.QuotaSet, None,
+            project_id=resource.Resource._get_id(project))
 
         if not query:
             query = {}
@@ -1110,57 +1130,64 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
     def _service_cleanup(self, dry_run=True, client_status_queue=None,
                          identified_resources=None,
                          filters=None, resource_evaluation_fn=None):
-        backups = []
-        for obj in self.backups(details=False):
-            need_delete = self._service_cleanup_del_res(
-                self.delete_backup,
-                obj,
-                dry_run=dry_run,
-                client_status_queue=client_status_queue,
-                identified_resources=identified_resources,
-                filters=filters,
-                resource_evaluation_fn=resource_evaluation_fn)
-            if not dry_run and need_delete:
-                backups.append(obj)
-
-        # Before deleting snapshots need to wait for backups to be deleted
-        for obj in backups:
-            try:
-                self.wait_for_delete(obj)
-            except exceptions.SDKException:
-                # Well, did our best, still try further
-                pass
-
-        snapshots = []
-        for obj in self.snapshots(details=False):
-            need_delete = self._service_cleanup_del_res(
-                self.delete_snapshot,
-                obj,
-                dry_run=dry_run,
-                client_status_queue=client_status_queue,
-                identified_resources=identified_resources,
-                filters=filters,
-                resource_evaluation_fn=resource_evaluation_fn)
-            if not dry_run and need_delete:
-                snapshots.append(obj)
-
-        # Before deleting volumes need to wait for snapshots to be deleted
-        for obj in snapshots:
-            try:
-                self.wait_for_delete(obj)
-            except exceptions.SDKException:
-                # Well, did our best, still try further
-                pass
-
-        for obj in self.volumes(details=True):
-            self._service_cleanup_del_res(
-                self.delete_volume,
-                obj,
-                dry_run=dry_run,
-                client_status_queue=client_status_queue,
-                identified_resources=identified_resources,
-                filters=filters,
-                resource_evaluation_fn=resource_evaluation_fn)
+        # Waits are dispatched while the lists are still being consumed,
+        # so polling for early deletes overlaps with fetching further
+        # pages and issuing further deletes. The drain calls keep the
+        # ordering barriers: backups gone before snapshots, snapshots
+        # gone before volumes.
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=8) as executor:
+            waits = []
+            for obj in self.backups(details=False,
+                                    limit=_CLEANUP_PAGE_SIZE):
+                need_delete = self._service_cleanup_del_res(
+                    self.delete_backup,
+                    obj,
+                    dry_run=dry_run,
+                    client_status_queue=client_status_queue,
+                    identified_resources=identified_resources,
+                    filters=filters,
+                    resource_evaluation_fn=resource_evaluation_fn)
+                if not dry_run and need_delete:
+                    waits.append(executor.submit(self.wait_for_delete, obj))
+
+            # Before deleting snapshots need to wait for backups to be
+            # deleted
+            self._service_cleanup_drain_waits(waits)
+
+            waits = []
+            for obj in self.snapshots(details=False,
+                                      limit=_CLEANUP_PAGE_SIZE):
+                need_delete = self._service_cleanup_del_res(
+                    self.delete_snapshot,
+                    obj,
+                    dry_run=dry_run,
+                    client_status_queue=client_status_queue,
+                    identified_resources=identified_resources,
+                    filters=filters,
+                    resource_evaluation_fn=resource_evaluation_fn)
+                if not dry_run and need_delete:
+                    waits.append(executor.submit(self.wait_for_delete, obj))
+
+            # Before deleting volumes need to wait for snapshots to be
+            # deleted
+            self._service_cleanup_drain_waits(waits)
+
+            # The brief listing is enough to identify and delete
+            # volumes; only pay for /volumes/detail when a date filter
+            # or a custom evaluation function needs the extra
+            # attributes.
+            details = bool(filters) or resource_evaluation_fn is not None
+            for obj in self.volumes(details=details,
+                                    limit=_CLEANUP_PAGE_SIZE):
+                self._service_cleanup_del_res(
+                    self.delete_volume,
+                    obj,
+                    dry_run=dry_run,
+                    client_status_queue=client_status_queue,
+                    identified_resources=identified_resources,
+                    filters=filters,
+                    resource_evaluation_fn=resource_evaluation_fn)
 
     def get_volume_metadata(self, volume):
         """Return a dictionary of metadata for a volume
@@ -1191,20 +1218,27 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
         volume = self._get_resource(_volume.Volume, volume)
         return volume.set_metadata(self, metadata=metadata)
 
-    def delete_volume_metadata(self, volume, keys=None):
+    def delete_volume_metadata(self, volume, keys=None, batch=False):
         """Delete metadata for a volume
 
         :param volume: Either the ID of a volume or a
             :class:`~openstack.block_storage.v3.volume.Volume`.
         :param list keys: The keys to delete. If left empty complete
             metadata will be removed.
+        :param bool batch: When ``True`` and ``keys`` is given, fetch
+            the current metadata once and push the remaining items back
+            in a single replace call instead of deleting every key with
+            its own request. Metadata added by another client between
+            the fetch and the replace is lost.
 
         :rtype: ``None``
         """
         volume = self._get_resource(_volume.Volume, volume)
         if keys is not None:
-            for key in keys:
-                volume.delete_metadata_item(self, key)
+            if batch:
+                self._replace_metadata_without_keys(volume, keys)
+            else:
+                self._delete_metadata_items(volume, keys)
         else:
             volume.delete_metadata(self)
 
@@ -1239,19 +1273,26 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
         snapshot = self._get_resource(_snapshot.Snapshot, snapshot)
         return snapshot.set_metadata(self, metadata=metadata)
 
-    def delete_snapshot_metadata(self, snapshot, keys=None):
+    def delete_snapshot_metadata(self, snapshot, keys=None, batch=False):
         """Delete metadata for a snapshot
 
         :param snapshot: Either the ID of a snapshot or a
             :class:`~openstack.block_storage.v3.snapshot.Snapshot`.
         :param list keys: The keys to delete. If left empty complete
             metadata will be removed.
+        :param bool batch: When ``True`` and ``keys`` is given, fetch
+            the current metadata once and push the remaining items back
+            in a single replace call instead of deleting every key with
+            its own request. Metadata added by another client between
+            the fetch and the replace is lost.
 
         :rtype: ``None``
         """
         snapshot = self._get_resource(_snapshot.Snapshot, snapshot)
         if keys is not None:
-            for key in keys:
-                snapshot.delete_metadata_item(self, key)
+            if batch:
+                self._replace_metadata_without_keys(snapshot, keys)
+            else:
+                self._delete_metadata_items(snapshot, keys)
         else:
             snapshot.delete_metadata(self)
@@ -10,6 +10,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import concurrent.futures
+
 from openstack import exceptions
 from openstack import resource
 from openstack import utils
@@ -81,14 +83,40 @@ class Type(resource.Resource):
         """Delete extra_specs
 
         Note: This method will do a HTTP DELETE request for every key in keys.
+        The requests are issued concurrently over the pooled session so that
+        deleting N keys does not cost N serial round-trips.
 
         :param session: The session to use for this request.
         :param list keys: The keys to delete.
 
         :rtype: ``None``
+        :raises: :class:`~openstack.exceptions.SDKException` when one or more
+            keys could not be deleted. All keys are attempted before the
+            failures are reported.
         """
-        for key in keys:
-            self._extra_specs(session.delete, key=key, delete=True)
+        keys = list(keys)
+        if not keys:
+            return
+        if len(keys) == 1:
+            self._extra_specs(session.delete, key=keys[0], delete=True)
+            return
+
+        errors = []
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(len(keys), 16)) as executor:
+            futures = {
+                executor.submit(
+                    self._extra_specs, session.delete, key=key, delete=True,
+                ): key
+                for key in keys}
+            for completed in concurrent.futures.as_completed(futures):
+                try:
+                    completed.result()
+                except exceptions.SDKException as e:
+                    errors.append('%s: %s' % (futures[completed], str(e)))
+        if errors:
+            raise exceptions.SDKException(
+                'Failed to delete extra_specs: %s' % '; '.join(errors))
 
     def get_private_access(self, session):
         url = utils.urljoin(self.base_path, self.id, "os-volume-type-access")
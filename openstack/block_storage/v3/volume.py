@@ -125,14 +125,18 @@ class Volume(resource.Resource, metadata.MetadataMixin):
         self._action(session, body)
 
     def reset_status(
-        self, session, status, attach_status, migration_status
+        self, session, status, attach_status=None, migration_status=None
     ):
-        """Reset volume statuses (admin operation)"""
-        body = {'os-reset_status': {
-            'status': status,
-            'attach_status': attach_status,
-            'migration_status': migration_status
-        }}
+        """Reset volume statuses (admin operation)
+
+        All given statuses are sent in a single action request; fields left
+        as ``None`` are omitted from the body.
+        """
+        body = {'os-reset_status': {'status': status}}
+        if attach_status is not None:
+            body['os-reset_status']['attach_status'] = attach_status
+        if migration_status is not None:
+            body['os-reset_status']['migration_status'] = migration_status
         self._action(session, body)
 
     def revert_to_snapshot(self, session, snapshot_id):
@@ -15,19 +15,30 @@
 # openstack.resource.Resource.list and openstack.resource2.Resource.list
 import types  # noqa
 
+import concurrent.futures
+
 from openstack.block_storage.v3 import quota_set as _qs
+from openstack.block_storage.v3 import volume as _volume
 from openstack.cloud import _utils
 from openstack.cloud import exc
 from openstack import exceptions
 from openstack import proxy
 
 
+# Steady volume states; anything else means the listing is still in flux.
+_STEADY_VOLUME_STATES = frozenset(('available', 'error', 'in-use'))
+
+# Canonical kwarg names and the legacy cinderclient aliases they absorb.
+_VOLUME_KWARG_ALIASES = (
+    ('name', 'display_name'),
+    ('description', 'display_description'),
+)
+
+
 def _no_pending_volumes(volumes):
     """If there are any volumes not in a steady state, don't cache"""
-    for volume in volumes:
-        if volume['status'] not in ('available', 'error', 'in-use'):
-            return False
-    return True
+    return all(
+        volume['status'] in _STEADY_VOLUME_STATES for volume in volumes)
 
 
 class BlockStorageCloudMixin:
@@ -109,6 +120,14 @@ class BlockStorageCloudMixin:
         return _utils._get_entity(
             self, 'volume_type', name_or_id, filters)
 
+    def get_volume_type_by_id(self, id):
+        """ Get a volume type by ID
+
+        :param id: ID of the volume type.
+        :returns: A volume type ``munch.Munch``.
+        """
+        return self.block_storage.get_type(id)
+
     def create_volume(
             self, size,
             wait=True, timeout=None, image=None, bootable=None, **kwargs):
@@ -207,7 +226,6 @@ class BlockStorageCloudMixin:
         :raises: OpenStackCloudException on operation error.
         """
 
-        self.list_volumes.invalidate(self)
         volume = self.block_storage.find_volume(name_or_id)
 
         if not volume:
@@ -229,11 +247,15 @@ class BlockStorageCloudMixin:
         return True
 
     def get_volumes(self, server, cache=True):
+        server_id = server['id']
         volumes = []
         for volume in self.list_volumes(cache=cache):
             for attach in volume['attachments']:
-                if attach['server_id'] == server['id']:
+                if attach['server_id'] == server_id:
                     volumes.append(volume)
+                    # A volume can only be attached to a given server
+                    # once; no point scanning the other attachments.
+                    break
         return volumes
 
     def get_volume_limits(self, name_or_id=None):
@@ -246,14 +268,18 @@ class BlockStorageCloudMixin:
         :returns: Munch object with the limits
         """
         params = {}
-        project_id = None
         error_msg = "Failed to get limits"
         if name_or_id:
-
-            proj = self.get_project(name_or_id)
-            if not proj:
-                raise exc.OpenStackCloudException("project does not exist")
-            project_id = proj.id
+            if _utils._is_uuid_like(name_or_id):
+                # Already an id; cinder takes it as-is, no need to
+                # round-trip to keystone first.
+                project_id = name_or_id
+            else:
+                proj = self.get_project(name_or_id)
+                if not proj:
+                    raise exc.OpenStackCloudException(
+                        "project does not exist")
+                project_id = proj.id
             params['tenant_id'] = project_id
             error_msg = "{msg} for the project: {project} ".format(
                 msg=error_msg, project=name_or_id)
@@ -304,7 +330,10 @@ class BlockStorageCloudMixin:
             ignore_missing=False)
 
         if wait:
-            vol = self.get_volume(volume['id'])
+            # Wrap the id in a bare Resource locally rather than looking
+            # the volume up again; wait_for_status fetches fresh state on
+            # every poll anyway.
+            vol = _volume.Volume.existing(id=volume['id'])
             self.block_storage.wait_for_status(vol)
 
     def attach_volume(self, server, volume, device=None,
@@ -352,21 +381,31 @@ class BlockStorageCloudMixin:
 
         if wait:
             if not hasattr(volume, 'fetch'):
-                # If we got volume as dict we need to re-fetch it to be able to
-                # use wait_for_status.
-                volume = self.block_storage.get_volume(volume['id'])
+                # If we got volume as dict wrap it in a Resource locally
+                # to be able to use wait_for_status; the re-fetch it used
+                # to do here was redundant since the wait polls anyway.
+                volume = _volume.Volume.existing(id=volume['id'])
             self.block_storage.wait_for_status(
                 volume, 'in-use', wait=timeout)
         return attachment
 
+    def _get_volume_project_id(self, name_or_id):
+        """Resolve a project name or id to a bare project id.
+
+        UUID-shaped input is passed through untouched - the cinder
+        quota and limits APIs take the id as-is, so validating it
+        against keystone first would just add a round-trip.
+        """
+        if _utils._is_uuid_like(name_or_id):
+            return name_or_id
+        return self.identity.find_project(
+            name_or_id, ignore_missing=False).id
+
     def _get_volume_kwargs(self, kwargs):
-        name = kwargs.pop('name', kwargs.pop('display_name', None))
-        description = kwargs.pop('description',
-                                 kwargs.pop('display_description', None))
-        if name:
-            kwargs['name'] = name
-        if description:
-            kwargs['description'] = description
+        for canonical, alias in _VOLUME_KWARG_ALIASES:
+            value = kwargs.pop(canonical, kwargs.pop(alias, None))
+            if value:
+                kwargs[canonical] = value
         return kwargs
 
     @_utils.valid_kwargs('name', 'display_name',
@@ -462,14 +501,17 @@ class BlockStorageCloudMixin:
         :raises: OpenStackCloudTimeout if wait time exceeded.
         :raises: OpenStackCloudException on operation error.
         """
+        # Skip the None-valued optional fields entirely so they don't
+        # travel in the request body.
         payload = {
-            'name': name,
-            'volume_id': volume_id,
-            'description': description,
-            'force': force,
-            'is_incremental': incremental,
-            'snapshot_id': snapshot_id,
-        }
+            key: value for key, value in (
+                ('name', name),
+                ('volume_id', volume_id),
+                ('description', description),
+                ('force', force),
+                ('is_incremental', incremental),
+                ('snapshot_id', snapshot_id),
+            ) if value is not None}
 
         backup = self.block_storage.create_backup(**payload)
 
@@ -624,6 +666,37 @@ class BlockStorageCloudMixin:
 
         self.block_storage.add_type_access(volume_type, project_id)
 
+    def add_volume_type_access_bulk(self, name_or_id, project_ids):
+        """Grant access on a volume_type to several projects.
+
+        The volume type is resolved once and the per-project grants are
+        issued concurrently over the pooled session, since cinder has no
+        bulk access endpoint.
+
+        :param name_or_id: ID or name of a volume_type
+        :param project_ids: A list of project ids
+
+        NOTE: the call works even if the projects do not exist.
+
+        :raises: OpenStackCloudException on operation error.
+        """
+        volume_type = self.get_volume_type(name_or_id)
+        if not volume_type:
+            raise exc.OpenStackCloudException(
+                "VolumeType not found: %s" % name_or_id)
+        project_ids = list(project_ids)
+        if not project_ids:
+            return
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(len(project_ids), 16)) as executor:
+            futures = [
+                executor.submit(
+                    self.block_storage.add_type_access,
+                    volume_type, project_id)
+                for project_id in project_ids]
+        for future in futures:
+            future.result()
+
     def remove_volume_type_access(self, name_or_id, project_id):
         """Revoke access on a volume_type to a project.
 
@@ -648,13 +721,30 @@ class BlockStorageCloudMixin:
             quota does not exist.
         """
 
-        proj = self.identity.find_project(
-            name_or_id, ignore_missing=False)
-
         self.block_storage.update_quota_set(
-            _qs.QuotaSet(project_id=proj.id),
+            _qs.QuotaSet(project_id=self._get_volume_project_id(name_or_id)),
             **kwargs)
 
+    def set_volume_quotas_bulk(self, quotas):
+        """Set volume quotas for several projects concurrently.
+
+        :param dict quotas: mapping of project name or id to a dict of
+            quota key/value pairs for that project.
+
+        :raises: OpenStackCloudException if one of the projects does
+            not exist.
+        """
+        if not quotas:
+            return
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(len(quotas), 16)) as executor:
+            futures = [
+                executor.submit(
+                    self.set_volume_quotas, name_or_id, **kwargs)
+                for name_or_id, kwargs in quotas.items()]
+        for future in futures:
+            future.result()
+
     def get_volume_quotas(self, name_or_id):
         """ Get volume quotas for a project
 
@@ -663,11 +753,8 @@ class BlockStorageCloudMixin:
 
         :returns: Munch object with the quotas
         """
-        proj = self.identity.find_project(
-            name_or_id, ignore_missing=False)
-
         return self.block_storage.get_quota_set(
-            proj)
+            self._get_volume_project_id(name_or_id))
 
     def delete_volume_quotas(self, name_or_id):
         """ Delete volume quotas for a project
@@ -678,8 +765,5 @@ class BlockStorageCloudMixin:
 
         :returns: dict with the quotas
         """
-        proj = self.identity.find_project(
-            name_or_id, ignore_missing=False)
-
         return self.block_storage.revert_quota_set(
-            proj)
+            self._get_volume_project_id(name_or_id))
@@ -34,6 +34,17 @@ from openstack.cloud import meta
 _decorated_methods = []
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_jmespath(expression):
+    """Compile a jmespath expression, memoizing the parsed result.
+
+    Callers tend to reuse the same handful of filter expressions over
+    and over (polling loops around get_*/search_* especially), so parse
+    each distinct expression only once.
+    """
+    return jmespath.compile(expression)
+
+
 def _make_unicode(input):
     """Turn an input into unicode unconditionally
 
@@ -95,14 +106,19 @@ def _filter_list(data, name_or_id, filters):
         name_or_id = _make_unicode(name_or_id)
         identifier_matches = []
         bad_pattern = False
-        try:
-            fn_reg = re.compile(fnmatch.translate(name_or_id))
-        except sre_constants.error:
-            # If the fnmatch re doesn't compile, then we don't care,
-            # but log it in case the user DID pass a pattern but did
-            # it poorly and wants to know what went wrong with their
-            # search
-            fn_reg = None
+        fn_reg = None
+        # Without any glob characters the pattern can only ever match
+        # its literal self, which the exact comparison below already
+        # covers - don't run a regex against every entry in that case.
+        if any(char in name_or_id for char in ('*', '?', '[')):
+            try:
+                fn_reg = re.compile(fnmatch.translate(name_or_id))
+            except sre_constants.error:
+                # If the fnmatch re doesn't compile, then we don't care,
+                # but log it in case the user DID pass a pattern but did
+                # it poorly and wants to know what went wrong with their
+                # search
+                bad_pattern = True
         for e in data:
             e_id = _make_unicode(e.get('id', None))
             e_name = _make_unicode(e.get('name', None))
@@ -110,13 +126,8 @@ def _filter_list(data, name_or_id, filters):
             if ((e_id and e_id == name_or_id)
                     or (e_name and e_name == name_or_id)):
                 identifier_matches.append(e)
-            else:
+            elif fn_reg:
                 # Only try fnmatch if we don't match exactly
-                if not fn_reg:
-                    # If we don't have a pattern, skip this, but set the flag
-                    # so that we log the bad pattern
-                    bad_pattern = True
-                    continue
                 if ((e_id and fn_reg.match(e_id))
                         or (e_name and fn_reg.match(e_name))):
                     identifier_matches.append(e)
@@ -128,7 +139,7 @@ def _filter_list(data, name_or_id, filters):
         return data
 
     if isinstance(filters, str):
-        return jmespath.search(filters, data)
+        return _compile_jmespath(filters).search(data)
 
     def _dict_filter(f, d):
         if not d:
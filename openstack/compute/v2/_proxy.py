@@ -10,6 +10,9 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import concurrent.futures
+import functools
+import itertools
 import warnings
 
 from openstack.compute.v2 import aggregate as _aggregate
@@ -33,14 +36,51 @@ from openstack.compute.v2 import service as _service
 from openstack.compute.v2 import volume_attachment as _volume_attachment
 from openstack import exceptions
 from openstack.identity.v3 import project as _project
+from openstack.image.v2 import image as _image_v2
 from openstack.network.v2 import security_group as _sg
 from openstack import proxy
 from openstack import resource
 from openstack import utils
 
+# Shared read-only default for methods taking optional extra attrs;
+# saves a dict allocation per call. Never mutate it.
+_EMPTY = {}
+
+# Bound once at import; these helpers run in tight per-server loops and
+# the attribute chain would be re-walked on every call.
+_get_id = resource.Resource._get_id
+
+_FLAVORS_BASE = '/flavors'
+_FLAVORS_DETAIL = '/flavors/detail'
+_IMAGES_DETAIL = '/images/detail'
+_SERVERS_DETAIL = '/servers/detail'
+
+
+@functools.lru_cache(maxsize=None)
+def _warn_images_deprecated():
+    # Memoized so the (relatively expensive) warning machinery only runs
+    # once per process rather than on every images() call.
+    warnings.warn('This API is deprecated and may disappear shortly',
+                  DeprecationWarning)
+
 
 class Proxy(proxy.Proxy):
 
+    def _supports_microversion(self, version):
+        """Memoized utils.supports_microversion for gate checks.
+
+        The negotiated microversion doesn't change over the life of a
+        proxy, so the endpoint-data lookup and version comparison only
+        need to happen once per threshold.
+        """
+        try:
+            cache = self._microversion_support
+        except AttributeError:
+            cache = self._microversion_support = {}
+        if version not in cache:
+            cache[version] = utils.supports_microversion(self, version)
+        return cache[version]
+
     # ========== Extensions ==========
 
     def find_extension(self, name_or_id, ignore_missing=True):
@@ -164,11 +204,61 @@ class Proxy(proxy.Proxy):
 
         :returns: A generator of flavor objects
         """
-        base_path = '/flavors/detail' if details else '/flavors'
-        for flv in self._list(_flavor.Flavor, base_path=base_path, **query):
-            if get_extra_specs and not flv.extra_specs:
-                flv = flv.fetch_extra_specs(self)
-            yield flv
+        base_path = _FLAVORS_DETAIL if details else _FLAVORS_BASE
+        flavors = self._list(_flavor.Flavor, base_path=base_path, **query)
+        if not get_extra_specs or (
+            details and self._supports_microversion('2.61')
+        ):
+            # With microversion 2.61 the detail listing carries
+            # extra_specs inline, so there is nothing left to fetch.
+            yield from flavors
+            return
+        yield from self._fetch_flavor_extra_specs(flavors)
+
+    def flavors_prefetched(self, details=True, get_extra_specs=False,
+                           **query):
+        """Return a generator of flavors with page prefetching
+
+        Same as :meth:`flavors`, but the next page of results is fetched
+        on a background thread while the caller processes the current
+        one, overlapping the pagination round-trips with consumption.
+
+        :returns: A generator of flavor objects
+        """
+        return utils.prefetch_iterator(
+            self.flavors(details=details, get_extra_specs=get_extra_specs,
+                         **query))
+
+    def _fetch_flavor_extra_specs(self, flavors, batch_size=32,
+                                  max_workers=16):
+        """Fill in extra_specs on the given flavors, fetching concurrently.
+
+        Flavor listings don't carry extra_specs (before microversion
+        2.61), so every flavor missing them costs one GET. Instead of
+        paying that round-trip per flavor serially, fetch them for a
+        window of flavors at a time over the pooled session, yielding
+        the flavors in their original order.
+        """
+        flavors = iter(flavors)
+        while True:
+            chunk = list(itertools.islice(flavors, batch_size))
+            if not chunk:
+                return
+            to_fetch = [flv for flv in chunk if not flv.extra_specs]
+            if len(to_fetch) < 2:
+                for flv in chunk:
+                    if not flv.extra_specs:
+                        flv = flv.fetch_extra_specs(self)
+                    yield flv
+                continue
+            with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=min(len(to_fetch), max_workers)) as executor:
+                futures = {
+                    id(flv): executor.submit(flv.fetch_extra_specs, self)
+                    for flv in to_fetch}
+            for flv in chunk:
+                future = futures.get(id(flv))
+                yield future.result() if future else flv
 
     def flavor_add_tenant_access(self, flavor, tenant):
         """Adds tenant/project access to flavor.
@@ -400,11 +490,8 @@ class Proxy(proxy.Proxy):
         """
         aggregate = self._get_resource(_aggregate.Aggregate, aggregate)
         # We need to ensure we pass list of image IDs
-        if isinstance(images, str):
-            images = [images]
-        image_data = []
-        for img in images:
-            image_data.append({'id': img})
+        imgs = (images,) if isinstance(images, str) else images
+        image_data = [{'id': img} for img in imgs]
         return aggregate.precache_images(self, image_data)
 
     # ========== Images ==========
@@ -462,9 +549,8 @@ class Proxy(proxy.Proxy):
 
         :returns: A generator of image objects
         """
-        warnings.warn('This API is deprecated and may disappear shortly',
-                      DeprecationWarning)
-        base_path = '/images/detail' if details else None
+        _warn_images_deprecated()
+        base_path = _IMAGES_DETAIL if details else None
         return self._list(_image.Image, base_path=base_path, **query)
 
     def _get_base_resource(self, res, base):
@@ -509,7 +595,8 @@ class Proxy(proxy.Proxy):
     def delete_image_metadata(self, image, keys=None):
         """Delete metadata for an image
 
-        Note: This method will do a HTTP DELETE request for every key in keys.
+        Note: This method will do a HTTP DELETE request for every key in keys,
+        issued concurrently when there are several.
 
         :param image: Either the ID of an image or a
             :class:`~openstack.compute.v2.image.Image` instance.
@@ -520,10 +607,11 @@ class Proxy(proxy.Proxy):
         """
         res = self._get_base_resource(image, _image.Image)
         if keys is not None:
-            # Create a set as a snapshot of keys to avoid "changed during
-            # iteration"
-            for key in set(keys):
-                res.delete_metadata_item(self, key)
+            # Snapshot and dedupe the keys to avoid "changed during
+            # iteration"; sets are already both.
+            if not isinstance(keys, (set, frozenset)):
+                keys = dict.fromkeys(keys)
+            self._delete_metadata_items(res, keys)
         else:
             res.delete_metadata(self)
 
@@ -554,7 +642,7 @@ class Proxy(proxy.Proxy):
 
         :returns: ``None``
         """
-        attrs = {'user_id': user_id} if user_id else {}
+        attrs = {'user_id': user_id} if user_id else _EMPTY
         self._delete(_keypair.Keypair, keypair, ignore_missing=ignore_missing,
                      **attrs)
 
@@ -569,7 +657,7 @@ class Proxy(proxy.Proxy):
         :raises: :class:`~openstack.exceptions.ResourceNotFound`
             when no resource can be found.
         """
-        attrs = {'user_id': user_id} if user_id else {}
+        attrs = {'user_id': user_id} if user_id else _EMPTY
         return self._get(_keypair.Keypair, keypair, **attrs)
 
     def find_keypair(self, name_or_id, ignore_missing=True, user_id=None):
@@ -584,7 +672,7 @@ class Proxy(proxy.Proxy):
 
         :returns: One :class:`~openstack.compute.v2.keypair.Keypair` or None
         """
-        attrs = {'user_id': user_id} if user_id else {}
+        attrs = {'user_id': user_id} if user_id else _EMPTY
         return self._find(_keypair.Keypair, name_or_id,
                           ignore_missing=ignore_missing,
                           **attrs)
@@ -649,6 +737,61 @@ class Proxy(proxy.Proxy):
         else:
             self._delete(_server.Server, server, ignore_missing=ignore_missing)
 
+    def bulk_delete_servers(self, servers, ignore_missing=True, force=False,
+                            wait=False, wait_timeout=120, concurrency=16):
+        """Delete multiple servers concurrently
+
+        Teardown of many servers is dominated by the sequential DELETE
+        round-trips when done one at a time; this fans them out over a
+        thread pool sharing the pooled session. With ``wait`` the
+        per-server disappearance polling is fanned out on the same pool
+        instead of waiting for one server at a time.
+
+        :param servers: An iterable of server IDs or
+            :class:`~openstack.compute.v2.server.Server` instances.
+        :param bool ignore_missing: When set to ``False``
+            :class:`~openstack.exceptions.ResourceNotFound` will be
+            raised when a server does not exist.
+        :param bool force: When set to ``True``, the server deletions will
+            be forced immediately.
+        :param bool wait: When set to ``True``, block until every server
+            has actually disappeared.
+        :param int wait_timeout: Seconds to wait for each server to be
+            gone. Only used when ``wait`` is ``True``.
+        :param int concurrency: Maximum number of requests in flight at
+            once.
+
+        :returns: ``None``
+        """
+        servers = list(servers)
+        if not servers:
+            return
+        if len(servers) == 1 and not wait:
+            self.delete_server(servers[0], ignore_missing=ignore_missing,
+                               force=force)
+            return
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(servers), concurrency)
+        ) as executor:
+            futures = [
+                executor.submit(self.delete_server, server,
+                                ignore_missing=ignore_missing, force=force)
+                for server in servers
+            ]
+            for future in futures:
+                future.result()
+            if not wait:
+                return
+            waits = [
+                executor.submit(
+                    self.wait_for_delete,
+                    self._get_resource(_server.Server, server),
+                    wait=wait_timeout)
+                for server in servers
+            ]
+            for future in waits:
+                future.result()
+
     def find_server(self, name_or_id, ignore_missing=True):
         """Find a single server
 
@@ -689,9 +832,22 @@ class Proxy(proxy.Proxy):
         """
         if all_projects:
             query['all_projects'] = True
-        base_path = '/servers/detail' if details else None
+        base_path = _SERVERS_DETAIL if details else None
         return self._list(_server.Server, base_path=base_path, **query)
 
+    def servers_prefetched(self, details=True, all_projects=False, **query):
+        """Retrieve a generator of servers with page prefetching
+
+        Same as :meth:`servers`, but the next page of results is fetched
+        on a background thread while the caller processes the current
+        one, overlapping the pagination round-trips with consumption.
+
+        :returns: A generator of server instances.
+        """
+        return utils.prefetch_iterator(
+            self.servers(details=details, all_projects=all_projects,
+                         **query))
+
     def update_server(self, server, **attrs):
         """Update a server
 
@@ -741,6 +897,72 @@ class Proxy(proxy.Proxy):
         res = self._get_base_resource(server, _server.Server)
         res.reset_state(self, state)
 
+    def bulk_server_action(self, servers, action, *args,
+                           concurrency=16, **kwargs):
+        """Invoke the same action on multiple servers concurrently
+
+        Fleet-wide operations pay one POST round-trip per server when
+        looped serially; this fans the action requests out over a
+        thread pool sharing the pooled session.
+
+        :param servers: An iterable of server IDs or
+            :class:`~openstack.compute.v2.server.Server` instances.
+        :param str action: Name of the
+            :class:`~openstack.compute.v2.server.Server` action method
+            to invoke, e.g. ``'start'``, ``'stop'``, ``'reboot'``.
+        :param args: Positional arguments passed to the action, after
+            the session.
+        :param int concurrency: Maximum number of requests in flight at
+            once. Keyword-only, so action arguments can be passed
+            positionally.
+        :param kwargs: Keyword arguments passed to the action.
+
+        :returns: A dict mapping each server ID to ``None`` on success
+            or to the exception the action raised for that server.
+        """
+        resolved = [self._get_resource(_server.Server, s) for s in servers]
+        if not resolved:
+            return {}
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(resolved), concurrency)
+        ) as executor:
+            futures = [
+                (s.id, executor.submit(getattr(s, action), self,
+                                       *args, **kwargs))
+                for s in resolved
+            ]
+            return {sid: future.exception() for sid, future in futures}
+
+    def start_servers(self, servers, concurrency=16):
+        """Start multiple stopped servers concurrently
+
+        :returns: A dict mapping each server ID to ``None`` on success
+            or to the exception raised for that server.
+        """
+        return self.bulk_server_action(servers, 'start',
+                                       concurrency=concurrency)
+
+    def stop_servers(self, servers, concurrency=16):
+        """Stop multiple running servers concurrently
+
+        :returns: A dict mapping each server ID to ``None`` on success
+            or to the exception raised for that server.
+        """
+        return self.bulk_server_action(servers, 'stop',
+                                       concurrency=concurrency)
+
+    def reboot_servers(self, servers, reboot_type, concurrency=16):
+        """Reboot multiple servers concurrently
+
+        :param str reboot_type: The type of reboot to perform.
+            "HARD" and "SOFT" are the current options.
+
+        :returns: A dict mapping each server ID to ``None`` on success
+            or to the exception raised for that server.
+        """
+        return self.bulk_server_action(servers, 'reboot', reboot_type,
+                                       concurrency=concurrency)
+
     def reboot_server(self, server, reboot_type):
         """Reboot a server
 
@@ -793,7 +1015,7 @@ class Proxy(proxy.Proxy):
         :returns: None
         """
         server = self._get_resource(_server.Server, server)
-        flavor_id = resource.Resource._get_id(flavor)
+        flavor_id = _get_id(flavor)
         server.resize(self, flavor_id)
 
     def confirm_server_resize(self, server):
@@ -827,16 +1049,19 @@ class Proxy(proxy.Proxy):
         :param str name: The name of the image to be created.
         :param dict metadata: A dictionary of metadata to be set on the image.
 
-        :returns: :class:`~openstack.image.v2.image.Image` object.
+        :returns: :class:`~openstack.image.v2.image.Image` object. When
+            ``wait`` is ``False`` only the ``id`` is populated; fetch the
+            image to load the remaining attributes.
         """
         server = self._get_resource(_server.Server, server)
         image_id = server.create_image(self, name, metadata)
 
         self._connection.list_images.invalidate(self)
-        image = self._connection.get_image(image_id)
-
         if not wait:
-            return image
+            # The caller only needs a handle on the new image; skip the
+            # immediate GET and hand back a stub to fetch on demand.
+            return _image_v2.Image.new(id=image_id)
+        image = self._connection.get_image(image_id)
         return self._connection.wait_for_image(image, timeout=timeout)
 
     def backup_server(self, server, name, backup_type, rotation):
@@ -1055,6 +1280,70 @@ class Proxy(proxy.Proxy):
         security_group = self._get_resource(_sg.SecurityGroup, security_group)
         server.remove_security_group(self, security_group.name)
 
+    def set_server_security_groups(self, server, security_groups,
+                                   concurrency=8):
+        """Reconcile a server's security groups to the given set
+
+        Fetches the server's current groups once, diffs them against
+        the desired set locally, and issues only the add/remove actions
+        actually needed, fanned out concurrently. Orchestration code
+        that would otherwise loop add/remove per group and per server
+        saves the redundant round-trips.
+
+        :param server: Either the ID of a server or a
+            :class:`~openstack.compute.v2.server.Server` instance.
+        :param security_groups: Iterable of security group names or
+            :class:`~openstack.network.v2.security_group.SecurityGroup`
+            instances the server should end up with. The diff and the
+            Nova actions are name-based, so instances carrying only an
+            ID are resolved to their name with one extra lookup each.
+        :param int concurrency: Maximum number of action requests in
+            flight at once.
+
+        :returns: None
+        """
+        server = self._get_resource(_server.Server, server)
+        desired = set()
+        for security_group in security_groups:
+            if isinstance(security_group, str):
+                desired.add(security_group)
+                continue
+            security_group = self._get_resource(_sg.SecurityGroup,
+                                                security_group)
+            name = security_group.name
+            if not name:
+                # The server reports its groups by name, so an ID-only
+                # instance has to be resolved before diffing to avoid a
+                # bogus add/remove pair for a group the caller keeps.
+                name = self._connection.network.get_security_group(
+                    security_group.id).name
+            desired.add(name)
+        server.fetch_security_groups(self)
+        current = {sg['name'] for sg in server.security_groups or []}
+        calls = [
+            (server.add_security_group, name)
+            for name in desired - current
+        ]
+        calls += [
+            (server.remove_security_group, name)
+            for name in current - desired
+        ]
+        if not calls:
+            return
+        if len(calls) == 1:
+            method, name = calls[0]
+            method(self, name)
+            return
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(calls), concurrency)
+        ) as executor:
+            futures = [
+                executor.submit(method, self, name)
+                for method, name in calls
+            ]
+            for future in futures:
+                future.result()
+
     # ========== Server IPs ==========
 
     def add_fixed_ip_to_server(self, server, network_id):
@@ -1123,7 +1412,7 @@ class Proxy(proxy.Proxy):
         :returns: The results of server interface creation
         :rtype: :class:`~openstack.compute.v2.server_interface.ServerInterface`
         """
-        server_id = resource.Resource._get_id(server)
+        server_id = _get_id(server)
         return self._create(_server_interface.ServerInterface,
                             server_id=server_id, **attrs)
 
@@ -1151,7 +1440,7 @@ class Proxy(proxy.Proxy):
         """
         server_id = self._get_uri_attribute(server_interface, server,
                                             "server_id")
-        server_interface = resource.Resource._get_id(server_interface)
+        server_interface = _get_id(server_interface)
 
         self._delete(_server_interface.ServerInterface,
                      server_interface,
@@ -1177,7 +1466,7 @@ class Proxy(proxy.Proxy):
         """
         server_id = self._get_uri_attribute(server_interface, server,
                                             "server_id")
-        server_interface = resource.Resource._get_id(server_interface)
+        server_interface = _get_id(server_interface)
 
         return self._get(_server_interface.ServerInterface,
                          server_id=server_id, port_id=server_interface)
@@ -1193,7 +1482,7 @@ class Proxy(proxy.Proxy):
         :returns: A generator of ServerInterface objects
         :rtype: :class:`~openstack.compute.v2.server_interface.ServerInterface`
         """
-        server_id = resource.Resource._get_id(server)
+        server_id = _get_id(server)
         return self._list(_server_interface.ServerInterface,
                           server_id=server_id, **query)
 
@@ -1208,7 +1497,7 @@ class Proxy(proxy.Proxy):
         :returns: A generator of ServerIP objects
         :rtype: :class:`~openstack.compute.v2.server_ip.ServerIP`
         """
-        server_id = resource.Resource._get_id(server)
+        server_id = _get_id(server)
         return self._list(server_ip.ServerIP,
                           server_id=server_id, network_label=network_label)
 
@@ -1266,7 +1555,8 @@ class Proxy(proxy.Proxy):
     def delete_server_metadata(self, server, keys=None):
         """Delete metadata for a server
 
-        Note: This method will do a HTTP DELETE request for every key in keys.
+        Note: This method will do a HTTP DELETE request for every key in keys,
+        issued concurrently when there are several.
 
         :param server: Either the ID of a server or a
             :class:`~openstack.compute.v2.server.Server` instance.
@@ -1277,10 +1567,11 @@ class Proxy(proxy.Proxy):
         """
         res = self._get_base_resource(server, _server.Server)
         if keys is not None:
-            # Create a set as a snapshot of keys to avoid "changed during
-            # iteration"
-            for key in set(keys):
-                res.delete_metadata_item(self, key)
+            # Snapshot and dedupe the keys to avoid "changed during
+            # iteration"; sets are already both.
+            if not isinstance(keys, (set, frozenset)):
+                keys = dict.fromkeys(keys)
+            self._delete_metadata_items(res, keys)
         else:
             res.delete_metadata(self)
 
@@ -1372,11 +1663,11 @@ class Proxy(proxy.Proxy):
         base_path = '/os-hypervisors/detail' if details else None
         if (
             'hypervisor_hostname_pattern' in query
-            and not utils.supports_microversion(self, '2.53')
+            and not self._supports_microversion('2.53')
         ):
             # Until 2.53 we need to use other API
-            base_path = '/os-hypervisors/{pattern}/search'.format(
-                pattern=query.pop('hypervisor_hostname_pattern'))
+            pattern = query.pop('hypervisor_hostname_pattern')
+            base_path = f'/os-hypervisors/{pattern}/search'
         return self._list(_hypervisor.Hypervisor, base_path=base_path, **query)
 
     def find_hypervisor(self, name_or_id, ignore_missing=True, details=True):
@@ -1440,7 +1731,7 @@ class Proxy(proxy.Proxy):
         :returns: Updated service instance
         :rtype: class: `~openstack.compute.v2.service.Service`
         """
-        if utils.supports_microversion(self, '2.53'):
+        if self._supports_microversion('2.53'):
             return self.update_service(
                 service, forced_down=forced)
 
@@ -1470,7 +1761,7 @@ class Proxy(proxy.Proxy):
         :returns: Updated service instance
         :rtype: class: `~openstack.compute.v2.service.Service`
         """
-        if utils.supports_microversion(self, '2.53'):
+        if self._supports_microversion('2.53'):
             attrs = {
                 'status': 'disabled'
             }
@@ -1494,7 +1785,7 @@ class Proxy(proxy.Proxy):
         :returns: Updated service instance
         :rtype: class: `~openstack.compute.v2.service.Service`
         """
-        if utils.supports_microversion(self, '2.53'):
+        if self._supports_microversion('2.53'):
             return self.update_service(
                 service, status='enabled')
 
@@ -1551,7 +1842,7 @@ class Proxy(proxy.Proxy):
         :returns: The updated service
         :rtype: :class:`~openstack.compute.v2.service.Service`
         """
-        if utils.supports_microversion(self, '2.53'):
+        if self._supports_microversion('2.53'):
             return self._update(_service.Service, service, **attrs)
 
         raise exceptions.SDKException(
@@ -1573,7 +1864,7 @@ class Proxy(proxy.Proxy):
         :rtype:
             :class:`~openstack.compute.v2.volume_attachment.VolumeAttachment`
         """
-        server_id = resource.Resource._get_id(server)
+        server_id = _get_id(server)
         return self._create(_volume_attachment.VolumeAttachment,
                             server_id=server_id, **attrs)
 
@@ -1600,7 +1891,7 @@ class Proxy(proxy.Proxy):
         """
         server_id = self._get_uri_attribute(volume_attachment, server,
                                             "server_id")
-        volume_attachment = resource.Resource._get_id(volume_attachment)
+        volume_attachment = _get_id(volume_attachment)
 
         return self._update(_volume_attachment.VolumeAttachment,
                             attachment_id=volume_attachment,
@@ -1629,7 +1920,7 @@ class Proxy(proxy.Proxy):
         """
         server_id = self._get_uri_attribute(volume_attachment, server,
                                             "server_id")
-        volume_attachment = resource.Resource._get_id(volume_attachment)
+        volume_attachment = _get_id(volume_attachment)
 
         self._delete(_volume_attachment.VolumeAttachment,
                      attachment_id=volume_attachment,
@@ -1662,26 +1953,29 @@ class Proxy(proxy.Proxy):
         """
         server_id = self._get_uri_attribute(volume_attachment, server,
                                             "server_id")
-        volume_attachment = resource.Resource._get_id(volume_attachment)
+        volume_attachment = _get_id(volume_attachment)
 
         return self._get(_volume_attachment.VolumeAttachment,
                          server_id=server_id,
                          attachment_id=volume_attachment,
                          ignore_missing=ignore_missing)
 
-    def volume_attachments(self, server):
+    def volume_attachments(self, server, **query):
         """Return a generator of volume attachments
 
         :param server: The server can be either the ID of a server or a
             :class:`~openstack.compute.v2.server.Server`.
+        :param kwargs query: Optional query parameters to be sent to
+            restrict the volume attachments to be returned, such as
+            ``limit``.
 
         :returns: A generator of VolumeAttachment objects
         :rtype:
             :class:`~openstack.compute.v2.volume_attachment.VolumeAttachment`
         """
-        server_id = resource.Resource._get_id(server)
+        server_id = _get_id(server)
         return self._list(_volume_attachment.VolumeAttachment,
-                          server_id=server_id)
+                          server_id=server_id, **query)
 
     # ========== Server Migrations ==========
 
@@ -1748,7 +2042,7 @@ class Proxy(proxy.Proxy):
         server_id = self._get_uri_attribute(
             server_migration, server, 'server_id',
         )
-        server_migration = resource.Resource._get_id(server_migration)
+        server_migration = _get_id(server_migration)
 
         self._delete(
             _server_migration.ServerMigration,
@@ -1811,7 +2105,7 @@ class Proxy(proxy.Proxy):
         server_id = self._get_uri_attribute(
             server_migration, server, 'server_id',
         )
-        server_migration = resource.Resource._get_id(server_migration)
+        server_migration = _get_id(server_migration)
 
         return self._get(
             _server_migration.ServerMigration,
@@ -1820,31 +2114,41 @@ class Proxy(proxy.Proxy):
             ignore_missing=ignore_missing,
         )
 
-    def server_migrations(self, server):
+    def server_migrations(self, server, **query):
         """Return a generator of migrations for a server.
 
         :param server: The server can be either the ID of a server or a
             :class:`~openstack.compute.v2.server.Server`.
+        :param kwargs query: Optional query parameters to be sent to
+            restrict the migrations to be returned, such as ``limit``.
 
         :returns: A generator of ServerMigration objects
         :rtype:
             :class:`~openstack.compute.v2.server_migration.ServerMigration`
         """
-        server_id = resource.Resource._get_id(server)
+        server_id = _get_id(server)
         return self._list(
             _server_migration.ServerMigration,
             server_id=server_id,
+            **query,
         )
 
     # ========== Migrations ==========
 
-    def migrations(self):
+    def migrations(self, **query):
         """Return a generator of migrations for all servers.
 
+        :param kwargs query: Optional query parameters to be sent to
+            restrict the migrations to be returned. Available parameters
+            include: ``host``, ``status``, ``migration_type``,
+            ``source_compute``, ``instance_uuid`` and ``limit``, which
+            are applied server-side so only matching migrations are
+            transferred.
+
         :returns: A generator of Migration objects
         :rtype: :class:`~openstack.compute.v2.migration.Migration`
         """
-        return self._list(_migration.Migration)
+        return self._list(_migration.Migration, **query)
 
     # ========== Server diagnostics ==========
 
@@ -1875,7 +2179,7 @@ class Proxy(proxy.Proxy):
         :returns: One
             :class:`~openstack.compute.v2.server_remote_console.ServerRemoteConsole`
         """
-        server_id = resource.Resource._get_id(server)
+        server_id = _get_id(server)
         return self._create(_src.ServerRemoteConsole,
                             server_id=server_id, **attrs)
 
@@ -1925,7 +2229,7 @@ class Proxy(proxy.Proxy):
         server = self._get_resource(_server.Server, server)
         # NOTE: novaclient supports undocumented type xcpvnc also supported
         # historically by OSC. We support it, but do not document either.
-        if utils.supports_microversion(self, '2.6'):
+        if self._supports_microversion('2.6'):
             console = self._create(
                 _src.ServerRemoteConsole,
                 server_id=server.id,
@@ -1954,8 +2258,6 @@ class Proxy(proxy.Proxy):
         project = self._get_resource(_project.Project, project)
         res = self._get_resource(
             _quota_set.QuotaSet, None, project_id=project.id)
-        if not query:
-            query = {}
         return res.fetch(
             self, usage=usage, **query)
 
@@ -1990,8 +2292,6 @@ class Proxy(proxy.Proxy):
         res = self._get_resource(
             _quota_set.QuotaSet, None, project_id=project.id)
 
-        if not query:
-            query = {}
         return res.delete(self, **query)
 
     def update_quota_set(self, quota_set, query=None, **attrs):
@@ -2007,9 +2307,7 @@ class Proxy(proxy.Proxy):
         :rtype: :class:`~openstack.compute.v2.quota_set.QuotaSet`
         """
         res = self._get_resource(_quota_set.QuotaSet, quota_set, **attrs)
-        if not query:
-            query = {}
-        return res.commit(self, **query)
+        return res.commit(self, **(query or {}))
 
     # ========== Utilities ==========
 
@@ -2069,25 +2367,55 @@ class Proxy(proxy.Proxy):
     def _service_cleanup(self, dry_run=True, client_status_queue=None,
                          identified_resources=None,
                          filters=None, resource_evaluation_fn=None):
-        servers = []
-        for obj in self.servers():
-            need_delete = self._service_cleanup_del_res(
-                self.delete_server,
-                obj,
-                dry_run=dry_run,
-                client_status_queue=client_status_queue,
-                identified_resources=identified_resources,
-                filters=filters,
-                resource_evaluation_fn=resource_evaluation_fn)
-            if not dry_run and need_delete:
-                # In the dry run we identified, that server will go. To propely
-                # identify consequences we need to tell others, that the port
-                # will disappear as well
-                for port in self._connection.network.ports(device_id=obj.id):
+        # The server deletes and the delete polling are independent
+        # round-trips, so overlap them on a thread pool instead of paying
+        # one RTT at a time.
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=16) as executor:
+            servers = []
+            deletes = []
+
+            def _queue_delete(obj):
+                # Called by _service_cleanup_del_res only on the real
+                # (not dry_run) path; fan the DELETEs out instead of
+                # paying one round-trip per server.
+                deletes.append(
+                    (obj, executor.submit(self.delete_server, obj)))
+
+            # Prefetch the server listing on its own thread so the next
+            # page is pulled from Nova while this loop is busy deciding
+            # and dispatching Neutron port lookups for the current one.
+            for obj in utils.prefetch_iterator(self.servers(),
+                                               buffer_size=64):
+                need_delete = self._service_cleanup_del_res(
+                    _queue_delete,
+                    obj,
+                    dry_run=dry_run,
+                    client_status_queue=client_status_queue,
+                    identified_resources=identified_resources,
+                    filters=filters,
+                    resource_evaluation_fn=resource_evaluation_fn)
+                if not dry_run and need_delete:
+                    servers.append(obj)
+
+            for obj, future in deletes:
+                err = future.exception()
+                if err is not None:
+                    self.log.error('Cannot delete resource %s: %s', obj, err)
+
+            if servers and identified_resources is not None:
+                # In the dry run we identified, that those servers will go.
+                # To propely identify consequences we need to tell others,
+                # that their ports will disappear as well. Neutron ORs
+                # repeated filter values, so one listing covers every
+                # doomed server instead of one round-trip each.
+                for port in self._connection.network.ports(
+                        device_id=[srv.id for srv in servers]):
                     identified_resources[port.id] = port
-                servers.append(obj)
 
-        # We actually need to wait for servers to really disappear, since they
-        # might be still holding ports on the subnet
-        for server in servers:
-            self.wait_for_delete(server)
+            # We actually need to wait for servers to really disappear, since
+            # they might be still holding ports on the subnet
+            self._service_cleanup_drain_waits([
+                executor.submit(self.wait_for_delete, server)
+                for server in servers
+            ])
@@ -27,6 +27,13 @@ CONSOLE_TYPE_ACTION_MAPPING = {
     'serial': 'os-getSerialConsole'
 }
 
+# Prebuilt bodies for the two documented reboot types; the action POST
+# only serializes them, so sharing the dicts across calls is safe.
+_REBOOT_BODIES = {
+    'HARD': {'reboot': {'type': 'HARD'}},
+    'SOFT': {'reboot': {'type': 'SOFT'}},
+}
+
 
 class Server(resource.Resource, metadata.MetadataMixin, tag.TagMixin):
     resource_key = 'server'
@@ -285,7 +292,10 @@ class Server(resource.Resource, metadata.MetadataMixin, tag.TagMixin):
 
     def reboot(self, session, reboot_type):
         """Reboot server where reboot_type might be 'SOFT' or 'HARD'."""
-        body = {'reboot': {'type': reboot_type}}
+        body = _REBOOT_BODIES.get(reboot_type)
+        if body is None:
+            # Let the server validate anything non-standard.
+            body = {'reboot': {'type': reboot_type}}
         self._action(session, body)
 
     def force_delete(self, session):
@@ -393,6 +393,14 @@ class Connection(
                     **kwargs)
 
         self._session = None
+        # When the config does not already carry a caller-provided
+        # keystoneauth session (passed either directly or inside a
+        # CloudRegion), get_session() will construct one lazily and we
+        # are responsible for releasing its pooled connections on
+        # close(). A session the caller supplied may be shared with
+        # other clients and is theirs to close.
+        self._owns_session = (
+            getattr(self.config, '_keystone_session', None) is None)
         self._proxies = {}
         self.__pool_executor = pool_executor
         self._global_request_id = global_request_id
@@ -535,6 +543,13 @@ class Connection(
         if self.__pool_executor:
             self.__pool_executor.shutdown()
         self.config.set_auth_cache()
+        if self._owns_session and self._session is not None:
+            # All proxies share the keystoneauth session and with it one
+            # pool of persistent HTTP connections. Release those sockets
+            # explicitly instead of leaving them to the garbage collector.
+            transport = getattr(self._session, 'session', None)
+            if transport is not None:
+                transport.close()
 
     def set_global_request_id(self, global_request_id):
         self._global_request_id = global_request_id
@@ -10,6 +10,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import concurrent.futures
+import functools
 import urllib
 from urllib.parse import urlparse
 
@@ -26,6 +28,13 @@ from openstack import exceptions
 from openstack import resource
 
 
+# The cleanup filter values are the same handful of strings compared
+# against every resource in a service, so parse each one only once.
+@functools.lru_cache(maxsize=64)
+def _parse_cleanup_filter_date(value):
+    return iso8601.parse_date(value)
+
+
 # The _check_resource decorator is used on Proxy methods to ensure that
 # the `actual` argument is in fact the type of the `expected` argument.
 # It does so under two cases:
@@ -309,6 +318,9 @@ class Proxy(adapter.Adapter):
     def _get_resource(self, resource_type, value, **attrs):
         """Get a resource object to work on
 
+        This is a purely local operation: the resource is constructed (or
+        reused) from the given value without any requests to the server.
+
         :param resource_type: The type of resource to operate on. This should
             be a subclass of :class:`~openstack.resource.Resource` with a
             ``from_id`` method.
@@ -318,6 +330,11 @@ class Proxy(adapter.Adapter):
         :param attrs: A dict containing arguments for forming the request
             URL, if needed.
         """
+        if (value is not None and not attrs
+                and isinstance(value, resource_type)):
+            # An existing resource instance with nothing to update on it;
+            # hand it back as-is.
+            return value
         conn = self._get_connection()
         if value is None:
             # Create a bare resource
@@ -572,6 +589,64 @@ class Proxy(adapter.Adapter):
                          resource_evaluation_fn=None):
         return None
 
+    def _delete_metadata_items(self, res, keys, max_workers=8):
+        """Delete the given metadata keys from a resource.
+
+        The service only offers per-key DELETE requests; when several keys
+        are given the requests are issued concurrently over the pooled
+        session instead of serially. All keys are attempted; the first
+        failure is re-raised once the pool has drained.
+
+        :param res: A resource mixing in
+            :class:`~openstack.common.metadata.MetadataMixin`.
+        :param keys: Iterable of metadata keys to delete.
+        """
+        keys = list(keys)
+        if len(keys) < 2:
+            for key in keys:
+                res.delete_metadata_item(self, key)
+            return
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(len(keys), max_workers)) as executor:
+            futures = [
+                executor.submit(res.delete_metadata_item, self, key)
+                for key in keys]
+        for future in futures:
+            future.result()
+
+    def _replace_metadata_without_keys(self, res, keys):
+        """Delete the given metadata keys with a fetch and a replace.
+
+        Reads the current metadata once, drops the given keys and pushes
+        the remainder back in a single replace call - two requests no
+        matter how many keys are removed. The caller accepts that
+        metadata set by another client between the two requests is lost.
+
+        :param res: A resource mixing in
+            :class:`~openstack.common.metadata.MetadataMixin`.
+        :param keys: Iterable of metadata keys to delete.
+        """
+        keys = set(keys)
+        res.fetch_metadata(self)
+        metadata = {
+            key: value for key, value in (res.metadata or {}).items()
+            if key not in keys}
+        res.replace_metadata(self, metadata=metadata)
+
+    @staticmethod
+    def _service_cleanup_drain_waits(futures):
+        """Block until the given wait_for_delete futures complete.
+
+        Resources that fail or time out are ignored - cleanup is a best
+        effort operation and the caller proceeds with whatever is left.
+        """
+        for completed in concurrent.futures.as_completed(futures):
+            try:
+                completed.result()
+            except exceptions.SDKException:
+                # Well, did our best, still try further
+                pass
+
     def _service_cleanup_del_res(self, del_fn, obj, dry_run=True,
                                  client_status_queue=None,
                                  identified_resources=None,
@@ -623,7 +698,7 @@ class Proxy(adapter.Adapter):
                         res_val = getattr(obj, 'updated_at')
                     if res_val:
                         res_date = iso8601.parse_date(res_val)
-                        cmp_date = iso8601.parse_date(v)
+                        cmp_date = _parse_cleanup_filter_date(v)
                         if res_date and cmp_date and res_date <= cmp_date:
                             part_cond.append(True)
                         else:
@@ -880,7 +880,22 @@ class Resource(dict):
 
     @classmethod
     def _get_mapping(cls, component):
-        """Return a dict of attributes of a given component on the class"""
+        """Return a dict of attributes of a given component on the class
+
+        The attribute layout is fixed once the class body has executed, so
+        the mapping is computed a single time per class and component and
+        cached; rebuilding it would otherwise walk the whole MRO for every
+        resource instantiation.
+        """
+        # Check the class' own dict so subclasses don't inherit a parent's
+        # cache.
+        cache = cls.__dict__.get('_mapping_cache')
+        if cache is None:
+            cache = {}
+            cls._mapping_cache = cache
+        ret = cache.get(component)
+        if ret is not None:
+            return ret
         mapping = component._map_cls()
         ret = component._map_cls()
         for key, value in cls._attributes_iterator(component):
@@ -891,6 +906,7 @@ class Resource(dict):
                 mapping[key] = value.name
         for k, v in mapping.items():
             ret[v] = k
+        cache[component] = ret
         return ret
 
     @classmethod
@@ -1817,6 +1833,10 @@ class Resource(dict):
         # Track the total number of resources yielded so we can paginate
         # swift objects
         total_yielded = 0
+        # Both are invariant across rows; resolve them once instead of in
+        # the per-resource loop below.
+        connection = session._get_connection()
+        resource_factory = cls.existing
         while uri:
             # Copy query_params due to weird mock unittest interactions
             response = session.get(
@@ -1848,11 +1868,12 @@ class Resource(dict):
                 # argument and is practically a reserved word.
                 raw_resource.pop("self", None)
                 # We want that URI props are available on the resource
-                raw_resource.update(uri_params)
+                if uri_params:
+                    raw_resource.update(uri_params)
 
-                value = cls.existing(
+                value = resource_factory(
                     microversion=microversion,
-                    connection=session._get_connection(),
+                    connection=connection,
                     **raw_resource)
                 marker = value.id
                 yield value
@@ -2028,6 +2049,13 @@ def _normalize_status(status):
     return status
 
 
+# Polling backoff applied by the wait helpers below: the requested
+# interval is the initial delay, growing geometrically up to the cap so
+# that long transitions generate fewer requests.
+_WAIT_FACTOR = 1.5
+_WAIT_MAX = 10
+
+
 def wait_for_status(
     session,
     resource,
@@ -2047,7 +2075,8 @@ def wait_for_status(
     :param status: Desired status of the resource.
     :param list failures: Statuses that would indicate the transition
         failed such as 'ERROR'. Defaults to ['ERROR'].
-    :param interval: Number of seconds to wait between checks.
+    :param interval: Number of seconds to wait before the first check,
+        growing with exponential backoff between subsequent ones.
         Set to ``None`` to use the default interval.
     :param wait: Maximum number of seconds to wait for transition.
         Set to ``None`` to wait forever.
@@ -2077,7 +2106,9 @@ def wait_for_status(
     for count in utils.iterate_timeout(
             timeout=wait,
             message=msg,
-            wait=interval):
+            wait=interval,
+            factor=_WAIT_FACTOR,
+            wait_max=_WAIT_MAX):
         resource = resource.fetch(session)
 
         if not resource:
@@ -2105,7 +2136,8 @@ def wait_for_delete(session, resource, interval, wait):
     :type session: :class:`~keystoneauth1.adapter.Adapter`
     :param resource: The resource to wait on to be deleted.
     :type resource: :class:`~openstack.resource.Resource`
-    :param interval: Number of seconds to wait between checks.
+    :param interval: Number of seconds to wait before the first check,
+        growing with exponential backoff between subsequent ones.
     :param wait: Maximum number of seconds to wait for the delete.
 
     :return: Method returns self on success.
@@ -2118,7 +2150,9 @@ def wait_for_delete(session, resource, interval, wait):
             message="Timeout waiting for {res}:{id} to delete".format(
                 res=resource.__class__.__name__,
                 id=resource.id),
-            wait=interval):
+            wait=interval,
+            factor=_WAIT_FACTOR,
+            wait_max=_WAIT_MAX):
         try:
             resource = resource.fetch(session)
             if not resource:
@@ -71,7 +71,9 @@ class TestVolume(TestVolumeProxy):
         )
 
     def test_backend_pools(self):
-        self.verify_list(self.proxy.backend_pools, stats.Pools)
+        self.verify_list(
+            self.proxy.backend_pools, stats.Pools,
+            expected_kwargs={"paginated": False})
 
     def test_limits_get(self):
         self.verify_get(
@@ -110,7 +112,9 @@ class TestVolume(TestVolumeProxy):
         self.verify_update(self.proxy.update_group_type, group_type.GroupType)
 
     def test_extensions(self):
-        self.verify_list(self.proxy.extensions, extension.Extension)
+        self.verify_list(
+            self.proxy.extensions, extension.Extension,
+            expected_kwargs={"paginated": False})
 
     def test_get_volume_metadata(self):
         self._verify(
@@ -143,6 +147,12 @@ class TestVolume(TestVolumeProxy):
             method_args=["value", ["key"]],
             expected_args=[self.proxy, "key"])
 
+    def test_delete_volume_metadata_batch(self):
+        with mock.patch.object(
+                self.proxy, '_replace_metadata_without_keys') as replace:
+            self.proxy.delete_volume_metadata("value", ["key"], batch=True)
+        replace.assert_called_once_with(mock.ANY, ["key"])
+
     def test_volume_wait_for(self):
         value = volume.Volume(id='1234')
         self.verify_wait_for_status(
@@ -607,10 +617,32 @@ class TestType(TestVolumeProxy):
         self.verify_delete(
             self.proxy.delete_type_encryption, type.TypeEncryption, False)
 
+    def test_type_encryption_update_with_volume_type(self):
+        with mock.patch.object(self.proxy, '_get') as mock_get, \
+                mock.patch.object(self.proxy, '_update') as mock_update:
+            self.proxy.update_type_encryption(
+                volume_type='vt-id', key_size=256)
+            mock_get.assert_called_once_with(
+                type.TypeEncryption, volume_type_id='vt-id',
+                requires_id=False)
+            mock_update.assert_called_once_with(
+                type.TypeEncryption, mock_get.return_value, key_size=256)
+
     def test_type_encryption_delete_ignore(self):
         self.verify_delete(
             self.proxy.delete_type_encryption, type.TypeEncryption, True)
 
+    def test_type_encryption_delete_with_volume_type(self):
+        with mock.patch.object(self.proxy, '_get') as mock_get, \
+                mock.patch.object(self.proxy, '_delete') as mock_delete:
+            self.proxy.delete_type_encryption(volume_type='vt-id')
+            mock_get.assert_called_once_with(
+                type.TypeEncryption, volume_type_id='vt-id',
+                requires_id=False)
+            mock_delete.assert_called_once_with(
+                type.TypeEncryption, mock_get.return_value,
+                ignore_missing=True)
+
 
 class TestQuota(TestVolumeProxy):
     def test_get(self):
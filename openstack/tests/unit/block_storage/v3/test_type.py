@@ -118,6 +118,44 @@ class TestType(base.TestCase):
             headers={},
         )
 
+    def test_delete_extra_specs_multiple_keys(self):
+        sess = mock.Mock()
+        response = mock.Mock()
+        response.status_code = 200
+        sess.delete.return_value = response
+
+        sot = type.Type(id=FAKE_ID)
+
+        keys = ["hey", "ho"]
+
+        sot.delete_extra_specs(sess, keys)
+
+        sess.delete.assert_has_calls(
+            [
+                mock.call(
+                    "types/" + FAKE_ID + "/extra_specs/" + key,
+                    headers={},
+                )
+                for key in keys
+            ],
+            any_order=True,
+        )
+
+    def test_delete_extra_specs_multiple_keys_error(self):
+        sess = mock.Mock()
+        response = mock.Mock()
+        response.status_code = 400
+        response.content = None
+        sess.delete.return_value = response
+
+        sot = type.Type(id=FAKE_ID)
+
+        self.assertRaises(
+            exceptions.SDKException,
+            sot.delete_extra_specs,
+            sess,
+            ["hey", "ho"])
+
     def test_delete_extra_specs_error(self):
         sess = mock.Mock()
         response = mock.Mock()
@@ -200,6 +200,16 @@ class TestVolumeActions(TestVolume):
         self.sess.post.assert_called_with(
             url, json=body, microversion=sot._max_microversion)
 
+    def test_reset_status_partial(self):
+        sot = volume.Volume(**VOLUME)
+
+        self.assertIsNone(sot.reset_status(self.sess, 'available'))
+
+        url = 'volumes/%s/action' % FAKE_ID
+        body = {'os-reset_status': {'status': 'available'}}
+        self.sess.post.assert_called_with(
+            url, json=body, microversion=sot._max_microversion)
+
     @mock.patch('openstack.utils.require_microversion', autospec=True,
                 side_effect=[exceptions.SDKException()])
     def test_revert_to_snapshot_before_340(self, mv_mock):
@@ -40,6 +40,15 @@ class TestUtils(base.TestCase):
         ret = _utils._filter_list(data, 'donald', None)
         self.assertEqual([el1], ret)
 
+    def test__filter_list_name_or_id_exact_skips_fnmatch(self):
+        el1 = dict(id=100, name='donald')
+        el2 = dict(id=200, name='pluto')
+        data = [el1, el2]
+        with mock.patch.object(_utils.re, 'compile') as mock_compile:
+            ret = _utils._filter_list(data, 'donald', None)
+        self.assertEqual([el1], ret)
+        mock_compile.assert_not_called()
+
     def test__filter_list_name_or_id_special(self):
         el1 = dict(id=100, name='donald')
         el2 = dict(id=200, name='pluto[2017-01-10]')
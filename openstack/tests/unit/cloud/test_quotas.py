@@ -131,11 +131,6 @@ class TestQuotas(base.TestCase):
         project = self._get_project_data()
 
         self.register_uris([
-            dict(method='GET',
-                 uri=self.get_mock_url(
-                     'identity', 'public',
-                     append=['v3', 'projects', project.project_id]),
-                 json={'project': project.json_response['project']}),
             self.get_cinder_discovery_mock_dict(),
             dict(method='PUT',
                  uri=self.get_mock_url(
@@ -148,15 +143,27 @@ class TestQuotas(base.TestCase):
         self.cloud.set_volume_quotas(project.project_id, volumes=1)
         self.assert_calls()
 
-    def test_cinder_get_quotas(self):
+    def test_cinder_update_quotas_bulk(self):
         project = self._get_project_data()
 
         self.register_uris([
-            dict(method='GET',
+            self.get_cinder_discovery_mock_dict(),
+            dict(method='PUT',
                  uri=self.get_mock_url(
-                     'identity', 'public',
-                     append=['v3', 'projects', project.project_id]),
-                 json={'project': project.json_response['project']}),
+                     'volumev3', 'public',
+                     append=['os-quota-sets', project.project_id]),
+                 json=dict(quota_set={'volumes': 1}),
+                 validate=dict(
+                     json={'quota_set': {
+                         'volumes': 1}}))])
+        self.cloud.set_volume_quotas_bulk(
+            {project.project_id: {'volumes': 1}})
+        self.assert_calls()
+
+    def test_cinder_get_quotas(self):
+        project = self._get_project_data()
+
+        self.register_uris([
             self.get_cinder_discovery_mock_dict(),
             dict(method='GET',
                  uri=self.get_mock_url(
@@ -171,11 +178,6 @@ class TestQuotas(base.TestCase):
         project = self._get_project_data()
 
         self.register_uris([
-            dict(method='GET',
-                 uri=self.get_mock_url(
-                     'identity', 'public',
-                     append=['v3', 'projects', project.project_id]),
-                 json={'project': project.json_response['project']}),
             self.get_cinder_discovery_mock_dict(),
             dict(method='DELETE',
                  uri=self.get_mock_url(
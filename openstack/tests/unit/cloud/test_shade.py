@@ -498,6 +498,21 @@ class TestShade(base.TestCase):
                 pass
         mock_sleep.assert_called_with(1.0)
 
+    @mock.patch('time.sleep')
+    def test_iterate_timeout_backoff(self, mock_sleep):
+        iter = utils.iterate_timeout(
+            100, "test_iterate_timeout_backoff",
+            wait=1, factor=2.0, wait_max=3)
+        next(iter)
+        next(iter)
+        mock_sleep.assert_called_with(1.0)
+        next(iter)
+        mock_sleep.assert_called_with(2.0)
+        next(iter)
+        mock_sleep.assert_called_with(3.0)
+        next(iter)
+        mock_sleep.assert_called_with(3.0)
+
     def test__nova_extensions(self):
         body = [
             {
@@ -104,10 +104,6 @@ class TestVolume(base.TestCase):
                      'volumeAttachment': {
                          'volumeId': vol['id']}})),
             self.get_cinder_discovery_mock_dict(),
-            dict(method='GET',
-                 uri=self.get_mock_url(
-                     'volumev3', 'public', append=['volumes', vol['id']]),
-                 json={'volume': volume}),
             dict(method='GET',
                  uri=self.get_mock_url(
                      'volumev3', 'public', append=['volumes', vol['id']]),
@@ -139,10 +135,6 @@ class TestVolume(base.TestCase):
                      'volumeAttachment': {
                          'volumeId': vol['id']}})),
             self.get_cinder_discovery_mock_dict(),
-            dict(method='GET',
-                 uri=self.get_mock_url(
-                     'volumev3', 'public', append=['volumes', volume['id']]),
-                 json={'volume': errored_volume}),
             dict(method='GET',
                  uri=self.get_mock_url(
                      'volumev3', 'public', append=['volumes', volume['id']]),
@@ -238,8 +230,9 @@ class TestVolume(base.TestCase):
             self.get_cinder_discovery_mock_dict(),
             dict(method='GET',
                  uri=self.get_mock_url(
-                     'volumev3', 'public', append=['volumes', 'detail']),
-                 json={'volumes': [avail_volume]})])
+                     'volumev3', 'public',
+                     append=['volumes', volume['id']]),
+                 json={'volume': avail_volume})])
         self.cloud.detach_volume(server, volume)
         self.assert_calls()
 
@@ -260,10 +253,6 @@ class TestVolume(base.TestCase):
                      append=['servers', server['id'],
                              'os-volume_attachments', volume.id])),
             self.get_cinder_discovery_mock_dict(),
-            dict(method='GET',
-                 uri=self.get_mock_url(
-                     'volumev3', 'public', append=['volumes', 'detail']),
-                 json={'volumes': [errored_volume]}),
             dict(method='GET',
                  uri=self.get_mock_url(
                      'volumev3', 'public',
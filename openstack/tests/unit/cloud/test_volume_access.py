@@ -50,6 +50,20 @@ class TestVolumeAccess(base.TestCase):
         volume_type_got = self.cloud.get_volume_type(volume_type['name'])
         self.assertEqual(volume_type_got.id, volume_type['id'])
 
+    def test_get_volume_type_by_id(self):
+        volume_type = dict(
+            id='voltype01', description='volume type description', name='name',
+            is_public=False)
+        self.register_uris([
+            dict(method='GET',
+                 uri=self.get_mock_url(
+                     'volumev3', 'public',
+                     append=['types', volume_type['id']]),
+                 json={'volume_type': volume_type})])
+        volume_type_got = self.cloud.get_volume_type_by_id(volume_type['id'])
+        self.assertEqual(volume_type_got.id, volume_type['id'])
+        self.assert_calls()
+
     def test_get_volume_type_access(self):
         volume_type = dict(
             id='voltype01', description='volume type description', name='name',
@@ -170,6 +184,44 @@ class TestVolumeAccess(base.TestCase):
             len(self.cloud.get_volume_type_access(volume_type['name'])), 2)
         self.assert_calls()
 
+    def test_add_volume_type_access_bulk(self):
+        volume_type = dict(
+            id='voltype01', description='volume type description', name='name',
+            is_public=False)
+        project_001 = dict(volume_type_id='voltype01', name='name',
+                           project_id='prj01')
+        self.register_uris([
+            dict(method='GET',
+                 uri=self.get_mock_url(
+                     'volumev3', 'public',
+                     append=['types']),
+                 json={'volume_types': [volume_type]}),
+            dict(method='POST',
+                 uri=self.get_mock_url(
+                     'volumev3', 'public',
+                     append=['types', volume_type['id'], 'action']),
+                 json={'addProjectAccess': {
+                       'project': project_001['project_id']}},
+                 validate=dict(
+                     json={'addProjectAccess': {
+                         'project': project_001['project_id']}}))])
+        self.cloud.add_volume_type_access_bulk(
+            volume_type['name'], [project_001['project_id']])
+        self.assert_calls()
+
+    def test_add_volume_type_access_bulk_missing(self):
+        self.register_uris([
+            dict(method='GET',
+                 uri=self.get_mock_url(
+                     'volumev3', 'public',
+                     append=['types']),
+                 json={'volume_types': []})])
+        with testtools.ExpectedException(
+                openstack.cloud.OpenStackCloudException,
+                "VolumeType not found: MISSING"):
+            self.cloud.add_volume_type_access_bulk("MISSING", ['prj01'])
+        self.assert_calls()
+
     def test_add_volume_type_access_missing(self):
         volume_type = dict(
             id='voltype01', description='volume type description', name='name',
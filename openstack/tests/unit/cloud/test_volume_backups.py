@@ -146,9 +146,7 @@ class TestVolumeBackups(base.TestCase):
                      'backup': {
                          'name': backup_name,
                          'volume_id': volume_id,
-                         'description': None,
                          'force': False,
-                         'snapshot_id': None,
                          'incremental': False
                      }
                  })),
@@ -176,9 +174,7 @@ class TestVolumeBackups(base.TestCase):
                      'backup': {
                          'name': backup_name,
                          'volume_id': volume_id,
-                         'description': None,
                          'force': False,
-                         'snapshot_id': None,
                          'incremental': True
                      }
                  })),
@@ -208,7 +204,6 @@ class TestVolumeBackups(base.TestCase):
                      'backup': {
                          'name': backup_name,
                          'volume_id': volume_id,
-                         'description': None,
                          'force': False,
                          'snapshot_id': snapshot_id,
                          'incremental': False
@@ -29,6 +29,7 @@ from openstack.compute.v2 import server_ip
 from openstack.compute.v2 import server_migration
 from openstack.compute.v2 import server_remote_console
 from openstack.compute.v2 import service
+from openstack import exceptions
 from openstack import resource
 from openstack.tests.unit import test_proxy_base
 
@@ -191,6 +192,16 @@ class TestFlavor(TestComputeProxy):
             base_path="/flavors"
         )
 
+    @mock.patch("openstack.proxy.Proxy._list")
+    @mock.patch("openstack.compute.v2.flavor.Flavor.fetch_extra_specs")
+    def test_flavors_get_extra_concurrent(self, fetch_mock, list_mock):
+        flavors = [flavor.Flavor(id=str(i)) for i in range(3)]
+        list_mock.return_value = iter(flavors)
+        res = list(self.proxy.flavors(details=False, get_extra_specs=True))
+        self.assertEqual(3, fetch_mock.call_count)
+        fetch_mock.assert_called_with(self.proxy)
+        self.assertEqual([fetch_mock.return_value] * 3, res)
+
     def test_flavor_get_access(self):
         self._verify(
             "openstack.compute.v2.flavor.Flavor.get_access",
@@ -657,6 +668,35 @@ class TestCompute(TestComputeProxy):
     def test_server_delete_ignore(self):
         self.verify_delete(self.proxy.delete_server, server.Server, True)
 
+    def test_server_bulk_delete(self):
+        with mock.patch.object(self.proxy, 'delete_server') as delete_mock:
+            self.proxy.bulk_delete_servers(['id1', 'id2', 'id3'])
+        self.assertEqual(3, delete_mock.call_count)
+        delete_mock.assert_any_call('id2', ignore_missing=True, force=False)
+
+    def test_server_bulk_delete_wait(self):
+        with mock.patch.object(self.proxy, 'delete_server') as delete_mock, \
+                mock.patch.object(self.proxy, 'wait_for_delete') as wait_mock:
+            self.proxy.bulk_delete_servers(['id1', 'id2'], wait=True)
+        self.assertEqual(2, delete_mock.call_count)
+        self.assertEqual(2, wait_mock.call_count)
+
+    def test_bulk_server_action(self):
+        servers = [server.Server(id='id1'), server.Server(id='id2')]
+        with mock.patch.object(server.Server, 'stop') as stop_mock:
+            result = self.proxy.bulk_server_action(servers, 'stop')
+        self.assertEqual(2, stop_mock.call_count)
+        self.assertEqual({'id1': None, 'id2': None}, result)
+
+    def test_bulk_server_action_collects_exceptions(self):
+        error = exceptions.SDKException('nope')
+        with mock.patch.object(server.Server, 'start',
+                               side_effect=[None, error]):
+            result = self.proxy.start_servers(
+                [server.Server(id='id1'), server.Server(id='id2')],
+                concurrency=1)
+        self.assertEqual({'id1': None, 'id2': error}, result)
+
     def test_server_force_delete(self):
         self._verify(
             "openstack.compute.v2.server.Server.force_delete",
@@ -975,6 +1015,18 @@ class TestCompute(TestComputeProxy):
             method_args=["value", ["key"]],
             expected_args=[self.proxy, "key"])
 
+    def test_create_image_no_wait(self):
+        with mock.patch('openstack.compute.v2.server.Server.create_image') \
+                as ci_mock:
+            ci_mock.return_value = 'image_id'
+            connection_mock = mock.Mock()
+            self.proxy._connection = connection_mock
+
+            rsp = self.proxy.create_server_image('server', 'image_name')
+
+            self.assertEqual('image_id', rsp.id)
+            connection_mock.get_image.assert_not_called()
+
     def test_create_image(self):
         metadata = {'k1': 'v1'}
         with mock.patch('openstack.compute.v2.server.Server.create_image') \
@@ -1104,6 +1156,41 @@ class TestCompute(TestComputeProxy):
             method_args=["value", {'id': 'id', 'name': 'sg'}],
             expected_args=[self.proxy, 'sg'])
 
+    def test_set_server_security_groups(self):
+        srv = server.Server(id='sid',
+                            security_groups=[{'name': 'keep'},
+                                             {'name': 'drop'}])
+        with mock.patch.object(server.Server, 'fetch_security_groups'), \
+                mock.patch.object(server.Server, 'add_security_group') \
+                as add_mock, \
+                mock.patch.object(server.Server, 'remove_security_group') \
+                as remove_mock:
+            self.proxy.set_server_security_groups(
+                srv, [{'id': 'id1', 'name': 'keep'},
+                      {'id': 'id2', 'name': 'new'}],
+                concurrency=1)
+        add_mock.assert_called_once_with(self.proxy, 'new')
+        remove_mock.assert_called_once_with(self.proxy, 'drop')
+
+    def test_set_server_security_groups_resolves_ids(self):
+        srv = server.Server(id='sid', security_groups=[{'name': 'keep'}])
+        connection_mock = mock.Mock()
+        fetched = mock.Mock(spec=['name'])
+        fetched.name = 'keep'
+        connection_mock.network.get_security_group.return_value = fetched
+        self.proxy._connection = connection_mock
+        with mock.patch.object(server.Server, 'fetch_security_groups'), \
+                mock.patch.object(server.Server, 'add_security_group') \
+                as add_mock, \
+                mock.patch.object(server.Server, 'remove_security_group') \
+                as remove_mock:
+            self.proxy.set_server_security_groups(
+                srv, [{'id': 'id1'}], concurrency=1)
+        connection_mock.network.get_security_group.assert_called_once_with(
+            'id1')
+        add_mock.assert_not_called()
+        remove_mock.assert_not_called()
+
     def test_create_server_remote_console(self):
         self.verify_create(
             self.proxy.create_server_remote_console,
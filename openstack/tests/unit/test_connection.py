@@ -125,6 +125,35 @@ class TestConnection(_TestConnectionBase):
         self.assertEqual(mock_session, conn.session)
         self.assertEqual('auth.example.com', conn.config.name)
 
+    def test_close_releases_connection_pool(self):
+        conn = connection.Connection(cloud='sample-cloud')
+        transport = mock.Mock()
+        conn.session.session = transport
+        conn.close()
+        transport.close.assert_called_once_with()
+
+    def test_close_does_not_touch_provided_session(self):
+        mock_session = mock.Mock(spec=session.Session)
+        mock_session.auth = mock.Mock()
+        mock_session.auth.auth_url = 'https://auth.example.com'
+        mock_session.session = mock.Mock()
+        conn = connection.Connection(session=mock_session)
+        conn.close()
+        self.assertFalse(mock_session.session.close.called)
+
+    def test_close_does_not_touch_session_in_config(self):
+        mock_session = mock.Mock(spec=session.Session)
+        mock_session.auth = mock.Mock()
+        mock_session.auth.auth_url = 'https://auth.example.com'
+        mock_session.session = mock.Mock()
+        config = openstack.config.cloud_region.from_session(
+            session=mock_session,
+            load_yaml_config=False,
+            load_envvars=False)
+        conn = connection.Connection(config=config)
+        conn.close()
+        self.assertFalse(mock_session.session.close.called)
+
     def test_create_session(self):
         conn = connection.Connection(cloud='sample-cloud')
         self.assertIsNotNone(conn)
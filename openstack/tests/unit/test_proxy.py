@@ -543,6 +543,32 @@ class TestProxyCleanup(base.TestCase):
 
         self.delete_mock = mock.Mock()
 
+    def test_delete_metadata_items(self):
+        res = mock.Mock()
+
+        self.sot._delete_metadata_items(res, ['a', 'b', 'c'])
+
+        res.delete_metadata_item.assert_has_calls(
+            [mock.call(self.sot, key) for key in ('a', 'b', 'c')],
+            any_order=True)
+
+    def test_delete_metadata_items_single(self):
+        res = mock.Mock()
+
+        self.sot._delete_metadata_items(res, ['a'])
+
+        res.delete_metadata_item.assert_called_once_with(self.sot, 'a')
+
+    def test_replace_metadata_without_keys(self):
+        res = mock.Mock()
+        res.metadata = {'a': '1', 'b': '2', 'c': '3'}
+
+        self.sot._replace_metadata_without_keys(res, ['a', 'c'])
+
+        res.fetch_metadata.assert_called_once_with(self.sot)
+        res.replace_metadata.assert_called_once_with(
+            self.sot, metadata={'b': '2'})
+
     def test_filters_evaluation_created_at(self):
         self.assertTrue(
             self.sot._service_cleanup_resource_filters_evaluation(
@@ -134,6 +134,22 @@ class Test_urljoin(base.TestCase):
         self.assertEqual(result, u"http://www.example.com/ascii/extra_chars-™")
 
 
+class Test_prefetch_iterator(base.TestCase):
+
+    def test_items_in_order(self):
+        result = list(utils.prefetch_iterator(iter(range(10))))
+        self.assertEqual(list(range(10)), result)
+
+    def test_exception_propagates(self):
+        def _source():
+            yield 1
+            raise RuntimeError('boom')
+
+        it = utils.prefetch_iterator(_source())
+        self.assertEqual(1, next(it))
+        self.assertRaises(RuntimeError, next, it)
+
+
 class TestSupportsMicroversion(base.TestCase):
     def setUp(self):
         super(TestSupportsMicroversion, self).setUp()
@@ -33,13 +33,17 @@ def urljoin(*args):
     return '/'.join(str(a or '').strip('/') for a in args)
 
 
-def iterate_timeout(timeout, message, wait=2):
+def iterate_timeout(timeout, message, wait=2, factor=1.0, wait_max=None):
     """Iterate and raise an exception on timeout.
 
     This is a generator that will continually yield and sleep for
     wait seconds, and if the timeout is reached, will raise an exception
     with <message>.
 
+    When ``factor`` is greater than 1 the sleep grows geometrically on
+    every iteration, starting from ``wait`` and capped at ``wait_max``,
+    so that quick transitions are noticed promptly while long waits do
+    not hammer the API with a fixed polling rate.
     """
     log = _log.setup_logging('openstack.iterate_timeout')
 
@@ -59,6 +63,11 @@ def iterate_timeout(timeout, message, wait=2):
             "Wait value must be an int or float value. {wait} given"
             " instead".format(wait=wait))
 
+    if wait_max is not None:
+        # The cap should never undercut the starting interval a caller
+        # explicitly asked for.
+        wait_max = max(float(wait_max), wait)
+
     start = time.time()
     count = 0
     while (timeout is None) or (time.time() < start + timeout):
@@ -66,9 +75,48 @@ def iterate_timeout(timeout, message, wait=2):
         yield count
         log.debug('Waiting %s seconds', wait)
         time.sleep(wait)
+        wait *= factor
+        if wait_max is not None:
+            wait = min(wait, wait_max)
     raise exceptions.ResourceTimeout(message)
 
 
+def prefetch_iterator(iterator, buffer_size=2):
+    """Consume an iterator in a background thread, yielding its items.
+
+    This is a generator wrapping ``iterator`` so that the next items are
+    produced (e.g. the next page of results fetched) while the caller is
+    still processing the current one, keeping up to ``buffer_size`` items
+    buffered. Exceptions raised by the underlying iterator are re-raised
+    to the consumer.
+
+    The producer runs on a daemon thread; if the consumer abandons the
+    generator early the thread is left parked on the bounded queue and
+    reclaimed at interpreter exit.
+    """
+    results = queue.Queue(maxsize=buffer_size)
+
+    def _producer():
+        try:
+            for item in iterator:
+                results.put(('item', item))
+        except Exception as e:
+            results.put(('error', e))
+        else:
+            results.put(('end', None))
+
+    thread = threading.Thread(target=_producer, daemon=True)
+    thread.start()
+    while True:
+        kind, value = results.get()
+        if kind == 'item':
+            yield value
+        elif kind == 'error':
+            raise value
+        else:
+            return
+
+
 def get_string_format_keys(fmt_string, old_style=True):
     """Gets a list of required keys from a format string
 